@@ -67,7 +67,7 @@ class ConflictResolver(Pipe):
         if self.threshold > 0.0:
             resolved_spans = [
                 span for span in resolved_spans 
-                if getattr(span._, "score", 0.0) >= self.threshold
+                if span._.score >= self.threshold
             ]
         
         # Output to specified target
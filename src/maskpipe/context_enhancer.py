@@ -62,6 +62,13 @@ class ContextEnhancer(Pipe):
 
         # Store our own patterns
         self._patterns = []
+        # Patterns are compiled into the matcher as they are added
+        self.matcher = Matcher(self.nlp.vocab)
+        # Pattern metadata in parallel lists, indexed by a slot resolved from
+        # the matcher's integer match_id
+        self._slot_by_match_id: Dict[int, int] = {}
+        self._pattern_labels: List[str] = []
+        self._context_labels: List[Optional[str]] = []
 
     def __call__(self, doc: Doc) -> Doc:
         """Process document."""
@@ -77,51 +84,38 @@ class ContextEnhancer(Pipe):
         else:
             extended_doc = doc
 
-        # Build matcher with all patterns
-        matcher = Matcher(self.nlp.vocab)
-        pattern_map = {}  # Maps pattern_id to pattern config
-        
-        for idx, pattern_config in enumerate(self._patterns):            
-            label = pattern_config["label"]
-            pattern_list = pattern_config["pattern"]
-            context_label = pattern_config.get("context_label", None)
-            
-            pattern_id = f"{label}_{idx}"
-            matcher.add(pattern_id, [pattern_list])
-            pattern_map[pattern_id] = {
-                "label": label,
-                "pattern": pattern_list,
-                "context_label": context_label
-            }
-        
-        # Find all matches
-        matches = matcher(extended_doc)
+        # Find all matches and bucket them by the entity label of their pattern,
+        # so each span only looks at the matches that can apply to it
+        matches_by_label: Dict[str, List[Tuple[int, int, Optional[str]]]] = {}
+        slot_by_match_id = self._slot_by_match_id
+        pattern_labels = self._pattern_labels
+        context_labels = self._context_labels
+        for match_id, start, end in self.matcher(extended_doc):
+            slot = slot_by_match_id[match_id]
+            matches_by_label.setdefault(pattern_labels[slot], []).append(
+                (start, end, context_labels[slot])
+            )
 
         # Process each span
         processed_spans = []
         for span in spans:
             # Skip if already enhanced
-            if hasattr(span._, "context") and span._.context:
+            if span._.context:
                 processed_spans.append(span)
                 continue
          
             context_label = None
             context: Set[str] = set()
             
-            # Check all matches for this span
-            for match_id, start, end in matches:
-                match = doc[start:end]
-                if not self._in_context(span, match, len(doc)):
+            # Check the matches of this span's label
+            for start, end, match_context_label in matches_by_label.get(span.label_, ()):
+                if not self._in_context(span, start, end, len(doc)):
                     continue
-                
-                pattern_id = self.nlp.vocab.strings[match_id]
-                pattern_config = pattern_map.get(pattern_id)
-                
-                if pattern_config and pattern_config["label"] == span.label_:
-                    if pattern_config["context_label"]:
-                        context_label = pattern_config["context_label"]
-                    context_text = extended_doc[start:end].text
-                    context.add(context_text)
+
+                if match_context_label:
+                    context_label = match_context_label
+                context_text = extended_doc[start:end].text
+                context.add(context_text)
             
             # Apply results
             if context:
@@ -136,7 +130,18 @@ class ContextEnhancer(Pipe):
 
     def add_patterns(self, patterns: List[ContextPattern]) -> None:
         """Add patterns to the context enhancer."""
-        self._patterns.extend(patterns)
+        for pattern_config in patterns:
+            label = pattern_config["label"]
+            pattern_list = pattern_config["pattern"]
+            context_label = pattern_config.get("context_label", None)
+
+            slot = len(self._patterns)
+            pattern_id = f"{label}_{slot}"
+            self.matcher.add(pattern_id, [pattern_list])
+            self._slot_by_match_id[self.nlp.vocab.strings[pattern_id]] = slot
+            self._pattern_labels.append(label)
+            self._context_labels.append(context_label)
+            self._patterns.append(pattern_config)
 
     def _get_spans(self, doc: Doc) -> List[Span]:
         """Get current spans."""
@@ -163,27 +168,30 @@ class ContextEnhancer(Pipe):
                     return True
         return False
     
-    def _in_context(self, span: Span, match: Span, doc_length: int) -> bool:
-        """Check if match is in span's context window."""
+    def _in_context(self, span: Span, start: int, end: int, doc_length: int) -> bool:
+        """Check if the match at start:end is in span's context window."""
         # Check if match is one of the added_context_words
 
-        if match.start >= doc_length:
+        if start >= doc_length:
             return True
+        # Matches that run into the added context words are clipped to the doc
+        end = min(end, doc_length)
         
         context_window_start = max(0, span.start - self.context_before)
         context_window_end = min(doc_length, span.end + self.context_after)
 
         # Before context - check if match ends in the before-window
-        if (context_window_start < match.end <= span.start):
+        if (context_window_start < end <= span.start):
             return True
         
         # After context - check if match starts in the after-window
-        if (span.end <= match.start < context_window_end):
+        if (span.end <= start < context_window_end):
             return True
 
-        # Outside of window: try dependency-based relation as fallback
+        # Outside of window: try dependency-based relation as fallback; the
+        # match Span is only built here, where its tokens are needed
         if self.allow_dependency_link:
-            return self._has_dependency_link(span, match)
+            return self._has_dependency_link(span, span.doc[start:end])
         
         return False
     
@@ -193,7 +201,7 @@ class ContextEnhancer(Pipe):
         enhanced = Span(span.doc, span.start, span.end, label=label)
         
         # Calculate new score
-        original_score = getattr(span._, "score", 1.0)
+        original_score = span._.score
         new_score = min(
             max(original_score + self.confidence_boost, self.min_enhanced_score),
             1.0
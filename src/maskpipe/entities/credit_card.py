@@ -1,16 +1,14 @@
 from spacy.tokens import Span
 
-from .entity import Entity
+from .entity import NON_DIGITS, Entity
 
+# Digit sum of each digit doubled, as used by the Luhn algorithm
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
 
 def _luhn_checksum(span: Span) -> bool:
-    only_digits = ''.join(filter(str.isdigit, span.text))
-    digits = [int(d) for d in only_digits]
-    odd_digits = digits[-1::-2]
-    even_digits = digits[-2::-2]
-    checksum = sum(odd_digits)
-    for d in even_digits:
-        checksum += sum(int(dig) for dig in str(d * 2))
+    digits = span.text.encode("ascii", "ignore").translate(None, NON_DIGITS)
+    checksum = sum(d - 0x30 for d in digits[-1::-2])
+    checksum += sum(_LUHN_DOUBLED[d - 0x30] for d in digits[-2::-2])
     return checksum % 10 == 0
 
 CREDIT_CARD = Entity(
@@ -18,7 +18,8 @@ MMMM = [
     # EN
     "january", "february", "march", "april", "may", "june", "july", "august", "september", "october", "november", "december"
 ]
-MMMM_OR_MMM = MMM + MMMM
+# Deduplicated: NL and EN share several month names
+MMMM_OR_MMM = list(dict.fromkeys(MMM + MMMM))
 
 # Year
 YY = r"(?:\d{2})"
@@ -32,14 +33,15 @@ DATE = Entity(
 
         # YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD
         # or DD-MM-YYYY, DD/MM/YYYY, DD.MM.YYYY
-        {"score": 0.85, "pattern": [{"TEXT": {"REGEX": {"IN": [
-            rf"\b{YYYY}\-{MM}\-{DD}\b",
-            rf"\b{YYYY}\/{MM}\/{DD}\b",
-            rf"\b{YYYY}\.{MM}\.{DD}\b",
-            rf"\b{DD}\-{MM}\-{YYYY}\b",
-            rf"\b{DD}\/{MM}\/{YYYY}\b",
-            rf"\b{DD}\.{MM}\.{YYYY}\b"
-        ]}}}]},
+        # One alternation, so each token is searched once instead of once per format
+        {"score": 0.85, "pattern": [{"TEXT": {"REGEX": (
+            rf"\b(?:{YYYY}\-{MM}\-{DD}"
+            rf"|{YYYY}\/{MM}\/{DD}"
+            rf"|{YYYY}\.{MM}\.{DD}"
+            rf"|{DD}\-{MM}\-{YYYY}"
+            rf"|{DD}\/{MM}\/{YYYY}"
+            rf"|{DD}\.{MM}\.{YYYY})\b"
+        )}}]},
 
         # DD MM YYYY
         {"score": 0.65, "pattern": [{"TEXT": {"REGEX": rf"\b{DD}\b"}}, {"TEXT": {"REGEX": rf"\b{MM}\b"}}, {"TEXT": {"REGEX": rf"\b{YYYY}\b"}}]},
@@ -49,11 +51,11 @@ DATE = Entity(
 
 
         # DD-MM-YY or DD/MM/YY or DD.MM.YY
-        {"score": 0.6, "pattern": [{"TEXT": {"REGEX": {"IN": [
-            rf"\b{DD}\-{MM}\-{YY}\b",
-            rf"\b{DD}\/{MM}\/{YY}\b",
-            rf"\b{DD}\.{MM}\.{YY}\b"
-        ]}}}]},
+        {"score": 0.6, "pattern": [{"TEXT": {"REGEX": (
+            rf"\b(?:{DD}\-{MM}\-{YY}"
+            rf"|{DD}\/{MM}\/{YY}"
+            rf"|{DD}\.{MM}\.{YY})\b"
+        )}}]},
 
         # DD MMMM YYYY or DD MMM YYYY
         {"score": 0.75, "pattern": [
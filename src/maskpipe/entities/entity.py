@@ -18,6 +18,9 @@ from spacy.tokens import Doc, Span
 RedactorFunc = Union[str, Callable[[], str], Callable[[str], str]]
 CustomMatcherFunc = Callable[[Doc], List[Tuple[int, int, float]]]
 
+# Every byte except ASCII 0-9, for stripping separators with bytes.translate
+NON_DIGITS = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
 class Pattern(TypedDict):
     pattern: Required[Union[str, List[Dict[str, Any]]]]
     score: NotRequired[float]
@@ -1,9 +1,10 @@
 from schwifty import IBAN as schwiftyIBAN
+from spacy.tokens import Span
 
 from .entity import Entity
 
-def _iban_validator(iban) -> bool:
-    iban =schwiftyIBAN(iban, allow_invalid=True)
+def _iban_validator(span: Span) -> bool:
+    iban = schwiftyIBAN(span.text, allow_invalid=True)
     return iban.is_valid
 
 IBAN = Entity(
@@ -12,16 +13,15 @@ IBAN = Entity(
         "score": 0.5,
         "pattern": [
             {
-                "LOWER": { "REGEX": r"""                              # https://github.com/microsoft/presidio/blob/main/presidio-analyzer/presidio_analyzer/predefined_recognizers/generic/iban_recognizer.py
-                        \b([a-z]{2}[ \-]?[0-9]{2})               # country + check digits
+                "LOWER": { "REGEX": r"""(?ax)                          # ASCII classes, verbose layout
+                        # https://github.com/microsoft/presidio/blob/main/presidio-analyzer/presidio_analyzer/predefined_recognizers/generic/iban_recognizer.py
+                        (?<![a-z0-9])                          # no alphanumeric directly before
+                        ([a-z]{2}[ \-]?[0-9]{2})               # country + check digits
                         (?=(?:[ \-]?[a-z0-9]){9,30})           # look-ahead: ≥9 alphanumerics ahead
                         ((?:[ \-]?[a-z0-9]{3,5}){2})           # 2 mandatory blocks of 3-5 chars
-                        ([ \-]?[a-z0-9]{3,5})?                 # optional blocks (up to 5×)
-                        ([ \-]?[a-z0-9]{3,5})?
-                        ([ \-]?[a-z0-9]{3,5})?
-                        ([ \-]?[a-z0-9]{3,5})?
-                        ([ \-]?[a-z0-9]{3,5})?
-                        ([ \-]?[a-z0-9]{1,3})?\b                   # final 1-3 chars tail
+                        ((?:[ \-]?[a-z0-9]{3,5}){0,5})         # optional blocks (up to 5×)
+                        ([ \-]?[a-z0-9]{1,3})?                 # final 1-3 chars tail
+                        (?![a-z0-9])                           # no alphanumeric directly after
                     """
                 }
             }
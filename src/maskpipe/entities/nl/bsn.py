@@ -1,30 +1,42 @@
+from operator import mul
+
 from spacy.tokens import Span
 
-from ..entity import Entity
+from ..entity import NON_DIGITS, Entity
+
+# 11-proef weight of each of the nine digits
+_ELF_PROEF_WEIGHTS = (9, 8, 7, 6, 5, 4, 3, 2, -1)
+# The checksum is taken over ASCII byte values; this removes the '0' offset
+_ELF_PROEF_OFFSET = 0x30 * sum(_ELF_PROEF_WEIGHTS)
 
 def _elf_proef(span: Span) -> bool:
     """Validate BSN using the '11-proef' (elf proef) algorithm."""
-    only_digits = ''.join(filter(str.isdigit, span.text))
-    if len(set(only_digits)) == 1:
+    text = span.text
+    if len(text) < 8:
         return False
-
+    # Plain digit strings, the most common candidate, need no separator stripping
+    if text.isascii() and text.isdigit():
+        only_digits = text.encode("ascii")
+    else:
+        only_digits = text.encode("ascii", "ignore").translate(None, NON_DIGITS)
     if len(only_digits) == 8:
-        only_digits = "0" + only_digits
+        only_digits = b"0" + only_digits
         
     if len(only_digits) != 9:
         return False
 
-    total = 0
-    for char, factor in zip(only_digits, [9, 8, 7, 6, 5, 4, 3, 2, -1]):
-        total += int(char) * factor
+    # Reject numbers made of a single repeated digit; one bytes comparison
+    # against the first digit repeated nine times
+    if only_digits == only_digits[:1] * 9:
+        return False
 
+    total = sum(map(mul, only_digits, _ELF_PROEF_WEIGHTS)) - _ELF_PROEF_OFFSET
     return total % 11 == 0
 
 BSN = Entity(
     label="BSN",
     patterns=[
-        {"score": 0.5, "pattern": [{"LENGTH":  8, "IS_DIGIT": True}]},
-        {"score": 0.5, "pattern": [{"LENGTH":  9, "IS_DIGIT": True}]},
+        {"score": 0.5, "pattern": [{"LENGTH": {">=": 8, "<=": 9}, "IS_DIGIT": True}]},
         {"score": 0.4, "pattern": [{"SHAPE": {"IN": ["ddd.ddd.ddd", "ddd-ddd-ddd"]}}]},
         {"score": 0.4, "pattern": [{"SHAPE": "ddd"}, {"SHAPE": "ddd"}, {"SHAPE": "ddd"}]},
     ],
@@ -1,10 +1,15 @@
-from typing import List, Tuple
+import re
+from bisect import bisect_left
+from itertools import chain
+from typing import Iterator, List, Set, Tuple
 
 from phonenumbers import PhoneNumberMatcher as Matcher
 from spacy.tokens import Doc
 
 from .entity import Entity
 
+_DIGIT = re.compile(r"\d")
+
 class PhoneNumberMatcher():
     """Custom matcher for phone numbers using the phonenumbers library."""
     
@@ -18,16 +23,41 @@ class PhoneNumberMatcher():
         self.score = score
     
     def __call__(self, doc: Doc) -> List[Tuple[int, int, float]]:
+        # Every region scans the full text, but none can match without a digit
+        if _DIGIT.search(doc.text) is None:
+            return []
+
+        offsets = self._char_offsets(doc.text)
+        first = next(offsets, None)
+        if first is None:
+            return []
+
+        # Token boundary offsets, so character offsets map to tokens with a
+        # binary search instead of building a Span per match
+        starts = [token.idx for token in doc]
+        ends = [token.idx + len(token) for token in doc]
         matches = []
+        for char_start, char_end in chain((first,), offsets):
+            # Keep only matches that align with token boundaries
+            start = bisect_left(starts, char_start)
+            end = bisect_left(ends, char_end)
+            if (
+                start < len(starts) and starts[start] == char_start
+                and end < len(ends) and ends[end] == char_end
+            ):
+                matches.append((start, end + 1, self.score))
+        return matches
+
+    def _char_offsets(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Stream the character offsets of the numbers found for any region."""
+        seen: Set[Tuple[int, int]] = set()
         for region in self.regions:
-            for match in Matcher(text=doc.text, region=region, leniency=self.leniency):
-                try:
-                    span = doc.char_span(match.start, match.end)
-                    if span:
-                        matches.append((span.start, span.end, self.score))                            
-                except Exception:
-                    continue
-        return matches 
+            for match in Matcher(text=text, region=region, leniency=self.leniency):
+                # Numbers found for several regions are only reported once
+                offsets = (match.start, match.end)
+                if offsets not in seen:
+                    seen.add(offsets)
+                    yield offsets
 
 PHONE_NUMBER = Entity(
     label="PHONE_NUMBER",
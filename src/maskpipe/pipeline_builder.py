@@ -36,25 +36,30 @@ class PipelineBuilder:
         for component in self.components:
             if not nlp.has_pipe(component):
                 nlp.add_pipe(component)
+
+        # Resolve the pipes once; None when the component is disabled
+        self._recognizer = cast(Optional[Recognizer], self._get_pipe("recognizer"))
+        self._context_enhancer = cast(Optional[ContextEnhancer], self._get_pipe("context_enhancer"))
+        self._anonymizer = cast(Optional[Anonymizer], self._get_pipe("anonymizer"))
+
+    def _get_pipe(self, name: str) -> Optional[Any]:
+        return self.nlp.get_pipe(name) if name in self.components else None
         
     def add_entities(self, entities: List[Entity]):
         """Partition entities and add their patterns, matchers, and redactors to relevant components."""
         
         batch = self._partition_entities_for_components(entities)
         
-        if "recognizer" in self.components:
-            recognizer = cast(Recognizer, self.nlp.get_pipe("recognizer"))
-            recognizer.add_patterns(batch["recognizer"]["patterns"])
-            recognizer.add_custom_matchers(batch["recognizer"]["custom_matchers"])
-            recognizer.add_validators(batch["recognizer"]["validators"])
+        if self._recognizer is not None:
+            self._recognizer.add_patterns(batch["recognizer"]["patterns"])
+            self._recognizer.add_custom_matchers(batch["recognizer"]["custom_matchers"])
+            self._recognizer.add_validators(batch["recognizer"]["validators"])
 
-        if "context_enhancer" in self.components:
-            context_enhancer = cast(ContextEnhancer, self.nlp.get_pipe("context_enhancer"))
-            context_enhancer.add_patterns(batch["context_enhancer"]["patterns"])
+        if self._context_enhancer is not None:
+            self._context_enhancer.add_patterns(batch["context_enhancer"]["patterns"])
         
-        if "anonymizer" in self.components:
-            anonymizer = cast(Anonymizer, self.nlp.get_pipe("anonymizer"))
-            anonymizer.add_redactors(batch["anonymizer"]["redactors"])
+        if self._anonymizer is not None:
+            self._anonymizer.add_redactors(batch["anonymizer"]["redactors"])
 
     def _partition_entities_for_components(self, entities: List[Entity]) -> Dict[str, Dict[str, Any]]:
         batch = {
@@ -70,34 +75,47 @@ class PipelineBuilder:
                 "redactors": {}
             }
         }
+        label_mapping = self.label_mapping
+        use_recognizer = self._recognizer is not None
+        use_context_enhancer = self._context_enhancer is not None
+        use_anonymizer = self._anonymizer is not None
+        recognizer_patterns = batch["recognizer"]["patterns"]
+        custom_matchers = batch["recognizer"]["custom_matchers"]
+        validators = batch["recognizer"]["validators"]
+        context_patterns = batch["context_enhancer"]["patterns"]
+        redactors = batch["anonymizer"]["redactors"]
+
         for entity in entities:
-            label = self.label_mapping.get(entity.label, entity.label)
+            label = label_mapping.get(entity.label, entity.label)
         
-            if "recognizer" in self.components:
-                if entity.patterns:
-                    patterns_with_label = [
+            if use_recognizer:
+                patterns = entity.patterns
+                if patterns:
+                    recognizer_patterns.extend(
                         {**pattern, "label": label}
-                        for pattern in entity.patterns
-                    ]
-                    batch["recognizer"]["patterns"].extend(patterns_with_label)
+                        for pattern in patterns
+                    )
                 
-                if entity.custom_matcher:
-                    batch["recognizer"]["custom_matchers"][label] = entity.custom_matcher
+                custom_matcher = entity.custom_matcher
+                if custom_matcher:
+                    custom_matchers[label] = custom_matcher
             
-                if entity.validator:
-                    batch["recognizer"]["validators"][label] = entity.validator
+                validator = entity.validator
+                if validator:
+                    validators[label] = validator
         
-            if "context_enhancer" in self.components:                
-                if entity.context_patterns:
-                    context_patterns_with_label = [
+            if use_context_enhancer:
+                entity_context_patterns = entity.context_patterns
+                if entity_context_patterns:
+                    context_patterns.extend(
                         {**pattern, "label": label}
-                        for pattern in entity.context_patterns
-                    ]
-                    batch["context_enhancer"]["patterns"].extend(context_patterns_with_label)
+                        for pattern in entity_context_patterns
+                    )
             
-            if "anonymizer" in self.components:
-                if entity.redactor:
-                    batch["anonymizer"]["redactors"][label] = entity.redactor    
+            if use_anonymizer:
+                redactor = entity.redactor
+                if redactor:
+                    redactors[label] = redactor
             
         return batch
 
@@ -1,5 +1,7 @@
 import logging
 from collections.abc import Iterable
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import (
     Any,
@@ -9,6 +11,7 @@ from typing import (
     NotRequired,
     Optional,
     Required,
+    Set,
     Tuple,
     TypedDict,
     Union,
@@ -22,7 +25,7 @@ from spacy.language import Language
 from spacy.matcher import Matcher, PhraseMatcher
 from spacy.matcher.levenshtein import levenshtein_compare  # ty:ignore[unresolved-import]
 from spacy.pipeline import Pipe
-from spacy.tokens import Doc, Span
+from spacy.tokens import Doc, DocBin, Span
 from spacy.util import SimpleFrozenList, ensure_path
 
 from .span_filter import DEFAULT_HIERARCHY, hierarchical_merge_filter
@@ -42,14 +45,33 @@ SpansFilterFunc = Callable[[Iterable[Span], Iterable[Span]], Iterable[Span]]
 
 RECOGNIZER_DEFAULT_SPANS_KEY = "sc"
 
+# PhraseMatcher attributes that are read from the lexeme, so phrase patterns
+# matched on them only need the tokenizer, not the full pipeline.
+_LEXICAL_PHRASE_MATCHER_ATTRS = {None, "ORTH", "TEXT", "LOWER", "NORM", "SHAPE"}
+
+# The Matcher compares every fuzzy pattern token against every doc token, and
+# both sides repeat heavily across a document, so memoize the comparison.
+@lru_cache(maxsize=1 << 16)
+def _cached_levenshtein_compare(s1: str, s2: str, max_dist: int) -> bool:
+    return levenshtein_compare(s1, s2, max_dist)
+
 # Compatibility function for registry
 def anonymacy_levenshtein_compare(s1: str, s2: str, max_dist: int) -> bool:
-    return  levenshtein_compare(s1, s2, max_dist)
+    return _cached_levenshtein_compare(s1, s2, max_dist)
     
-@registry.misc("spacy.levenshtein_compare.v1")
+# Registered under a maskpipe name: spaCy populates its registry lazily and
+# its own "spacy.levenshtein_compare.v1" would replace ours, so configs naming
+# the spaCy entry get spaCy's uncached compare.
+@registry.misc("maskpipe.levenshtein_compare.v1")
 def make_levenshtein_compare():
     return anonymacy_levenshtein_compare
 
+def _patterns_from_bytes(data: Union[bytes, str]) -> List[Pattern]:
+    """Load serialized patterns, accepting the JSON string of older versions."""
+    if isinstance(data, str):
+        return cast(List[Pattern], srsly.json_loads(data))
+    return cast(List[Pattern], srsly.msgpack_loads(data))
+
 DEFAULT_RECOGNIZER_CONFIG = {
     "spans_key": RECOGNIZER_DEFAULT_SPANS_KEY,
     "spans_filter": None,
@@ -59,7 +81,7 @@ DEFAULT_RECOGNIZER_CONFIG = {
         "hierarchy": DEFAULT_HIERARCHY
     },
     "phrase_matcher_attr": None,
-    "matcher_fuzzy_compare": {"@misc": "spacy.levenshtein_compare.v1"},
+    "matcher_fuzzy_compare": {"@misc": "maskpipe.levenshtein_compare.v1"},
     "default_score": 0.6,
     "validate_patterns": False,
     "overwrite": False
@@ -91,7 +113,13 @@ class Recognizer(Pipe):
         self.annotate_ents = annotate_ents
         self.phrase_matcher_attr = phrase_matcher_attr
         self.matcher_fuzzy_compare = matcher_fuzzy_compare
-        self._match_label_id_map: Dict[int, Dict[str, Any]] = {}
+        # The default compare is only a registry-compatible wrapper; hand the
+        # Matcher the memoized function directly to skip one call per comparison.
+        self._fuzzy_compare = (
+            _cached_levenshtein_compare
+            if matcher_fuzzy_compare is anonymacy_levenshtein_compare
+            else matcher_fuzzy_compare
+        )
         self.validate_patterns = validate_patterns
         self.overwrite = overwrite
         self.clear()
@@ -99,13 +127,37 @@ class Recognizer(Pipe):
     def clear(self) -> None:
         """Reset all patterns.
         """
-        self._patterns: List[Pattern] = []
+        # Pattern metadata stored in parallel arrays, indexed by a slot that
+        # is resolved from the matcher's match_id. Removed slots are set to
+        # None in _patterns so the other arrays stay aligned, and are
+        # compacted away once they make up half of the slots.
+        self._patterns: List[Optional[Pattern]] = []
+        self._n_removed = 0
+        # Counter for unique matcher keys, which outlive slot numbers
+        self._next_key = 0
+        self._keys: List[str] = []
+        self._labels: List[str] = []
+        self._label_hashes: List[int] = []
+        self._ids: List[str] = []
+        self._id_hashes: List[int] = []
+        self._scores: List[float] = []
+        self._slot_by_string_id: Dict[int, int] = {}
+        # Tokenized phrase patterns by text, with the number of live patterns
+        # using each text. Adding a phrase that is already present or being
+        # loaded skips tokenization; a doc is dropped with its last pattern.
+        self._phrase_docs: Dict[str, Doc] = {}
+        self._phrase_refs: Dict[str, int] = {}
+        # Content keys of the added patterns, used to skip duplicates
+        self._pattern_keys: Set[Tuple[Any, ...]] = set()
+        # Reverse indexes from pattern label / pattern ID to matcher keys
+        self._string_ids_by_label: Dict[str, Set[int]] = {}
+        self._string_ids_by_id: Dict[str, Set[int]] = {}
         self._validators: Dict[str, Callable[[Span], bool]] = {}
         self._custom_matchers: Dict[str, Callable[[Doc], List[Tuple[int, int, float]]]] = {}
         self.matcher: Matcher = Matcher(
             self.nlp.vocab,
             validate=self.validate_patterns,
-            fuzzy_compare=self.matcher_fuzzy_compare,
+            fuzzy_compare=self._fuzzy_compare,
         )
         self.phrase_matcher: PhraseMatcher = PhraseMatcher(
             self.nlp.vocab,
@@ -122,16 +174,16 @@ class Recognizer(Pipe):
     @property
     def labels(self) -> Tuple[str, ...]:
         """All labels present in the match patterns."""
-        labels = [p["label"] for p in self._patterns]
+        labels = set(self._string_ids_by_label)
         if self._custom_matchers:
-            labels.extend(self._custom_matchers.keys())
+            labels.update(self._custom_matchers)
 
-        return tuple(sorted(set(labels)))
+        return tuple(sorted(labels))
 
     @property
     def patterns(self) -> List[Pattern]:
         """Get all patterns that were added."""
-        return self._patterns
+        return [p for p in self._patterns if p is not None]
 
     def __len__(self) -> int:
         """The number of all labels added to the span ruler."""
@@ -139,79 +191,98 @@ class Recognizer(Pipe):
 
     def __contains__(self, label: str) -> bool:
         """Whether a label is present in the patterns."""
-        for label_id in self._match_label_id_map.values():
-            if label_id["label"] == label:
-                return True
-        return False
+        return label in self._string_ids_by_label
 
     def match(self, doc: Doc) -> List[Span]:
         """Find all matches in the document."""
-        spans: dict[tuple[int, int], Span] = {}
-        
-        # Get matches from the main pattern matcher
-        matches = list(self.matcher(doc)) + list(self.phrase_matcher(doc))
+        if not len(doc):
+            return []
 
-        for match_id, start, end in matches:
-            if match_id not in self._match_label_id_map or start == end:
-                continue
-            
-            pattern_info = self._match_label_id_map[match_id]
-            label = pattern_info["label"]
-            score = min(pattern_info.get("score", self.default_score), 1.0)
-            
-            key = (start, end)
-            if key in spans and spans[key]._.score >= score:
-                continue
-            
-            span = doc[start:end]
-            span.label_ = label
-            span_id = pattern_info.get("id", "")
-            if isinstance(span_id, str):
-                span_id = doc.vocab.strings.add(span_id)
-            span.id = span_id
-            span._.score = score
-            if self._validators and not self._is_valid(span):
+        # Candidates per position as (-score, order, label hash, id hash). Spans
+        # are only built for the best candidate that passes validation, so
+        # positional collisions never allocate a Span.
+        candidates: dict[tuple[int, int], list[tuple[float, int, int, int]]] = {}
+        
+        # Get matches from the main pattern matcher, skipping matchers
+        # without patterns so their full token scan is not paid for nothing
+        match_lists: List[List[Tuple[int, int, int]]] = []
+        if len(self.matcher):
+            match_lists.append(self.matcher(doc))
+        if len(self.phrase_matcher):
+            match_lists.append(self.phrase_matcher(doc))
+
+        # Bind per-call lookups to locals; this loop runs once per raw match
+        order = 0
+        slot_by_string_id = self._slot_by_string_id
+        scores = self._scores
+        label_hashes = self._label_hashes
+        id_hashes = self._id_hashes
+        for match_id, start, end in chain.from_iterable(match_lists):
+            slot = slot_by_string_id.get(match_id, -1)
+            if slot < 0 or start == end:
                 continue
 
-            spans[key] = span
+            candidates.setdefault((start, end), []).append(
+                (-scores[slot], order, label_hashes[slot], id_hashes[slot])
+            )
+            order += 1
 
         if self._custom_matchers:
+            n_tokens = len(doc)
             for label, custom_matcher in self._custom_matchers.items():
                 custom_matches = custom_matcher(doc)
+                label_hash = doc.vocab.strings.add(label)
                 
                 for start, end, score in custom_matches:
-                    key = (start, end)
-                    
+                    # Reject empty or out-of-range offsets on the integers
+                    # before any candidate or Span is built for them
+                    if not 0 <= start < end <= n_tokens:
+                        continue
                     score = min(score, 1.0)
                     if score <= 0.0:
                         score = self.default_score
-                    
-                    if key in spans and spans[key]._.score >= score:
-                        continue
-
-                    span = doc[start:end]
-                    span.label_ = label
-                    span._.score = score
 
-                    if self._validators and not self._is_valid(span):
+                    candidates.setdefault((start, end), []).append((-score, order, label_hash, 0))
+                    order += 1
+
+        # Keys are unique (start, end) tuples, so sorting the items orders the
+        # output by position without comparing groups or calling a key function
+        spans: List[Span] = []
+        validate = bool(self._validators)
+        # span.text and span.label_ are built as log arguments, so only pay
+        # for them when debug logging is actually on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for (start, end), group in sorted(candidates.items()):
+            # Highest score first; equal scores keep the order they were found in
+            group.sort()
+            for neg_score, _, label, span_id in group:
+                span = Span(doc, start, end, label=label, span_id=span_id)
+                span._.score = -neg_score
+
+                if validate and not self._is_valid(span):
+                    if debug:
                         logger.debug("dropped span %r label=%s validator=False", span.text, span.label_)
-                        continue
-                
-                    spans[key] = span
+                    continue
+
+                spans.append(span)
+                break
 
-        return sorted(spans.values(), key=lambda s: (s.start, s.end))
+        return spans
 
     def set_annotations(self, doc, matches):
         """Modify the document in place"""
         if self.spans_key:
-            spans = []
-            if self.spans_key in doc.spans and not self.overwrite:
-                spans = doc.spans[self.spans_key]
-            spans.extend(
-                self.spans_filter(spans, matches) if self.spans_filter else matches
-            )
-
-            doc.spans[self.spans_key] = spans
+            keep_existing = self.spans_key in doc.spans and not self.overwrite
+            # A kept span group with nothing to add is left untouched
+            if not (keep_existing and not matches and self.spans_filter is None):
+                # Build one plain list and assign it once instead of extending
+                # the SpanGroup in place and assigning it back
+                spans: List[Span] = list(doc.spans[self.spans_key]) if keep_existing else []
+                # Materialize the filter result first: a lazy filter may still
+                # be reading the list it would otherwise be appended to
+                new_spans = list(self.spans_filter(spans, matches)) if self.spans_filter else matches
+
+                doc.spans[self.spans_key] = spans + new_spans
         
         # set doc.ents if annotate_ents is set
         if self.annotate_ents:
@@ -227,50 +298,97 @@ class Recognizer(Pipe):
 
         phrase_pattern_labels = []
         phrase_pattern_texts = []
+        n_duplicates = 0
 
-        for entry in patterns:
-            p_label = entry["label"]
-            p_id = entry.get("id", "")
-            p_score = entry.get("score", self.default_score)
-            
-            label = f"{p_label}_{len(self._patterns)}"
-
-            self._match_label_id_map[self.nlp.vocab.strings.as_int(label)] = {
-                "label": p_label,
-                "id": p_id,
-                "score": p_score
-            }
-            
-            if isinstance(entry["pattern"], str):
-                # Phrase pattern - store for later processing
-                phrase_pattern_labels.append(label)
-                phrase_pattern_texts.append(entry["pattern"])
-            elif isinstance(entry["pattern"], list):
-                # Token pattern - add directly
-                self.matcher.add(label, [entry["pattern"]])
-            else:
-                raise ValueError(f"Pattern must be string or list of dicts, got {type(entry['pattern'])}")
-            
-            self._patterns.append(entry)
-
-        # Temporarily disable the nlp components after this one in case they haven't been
-        # initialized / deserialized yet
         try:
-            current_index = -1
-            for i, (name, pipe) in enumerate(self.nlp.pipeline):
-                if self == pipe:
-                    current_index = i
-                    break
-            subsequent_pipes = [pipe for pipe in self.nlp.pipe_names[current_index:]]
-        except ValueError:
-            subsequent_pipes = []
-
-        with self.nlp.select_pipes(disable=subsequent_pipes):
-            for label, pattern in zip(
-                phrase_pattern_labels,
-                self.nlp.pipe(phrase_pattern_texts)
-            ):
-                self.phrase_matcher.add(label, [pattern])
+            for entry in patterns:
+                p_label = entry["label"]
+                p_id = entry.get("id", "")
+                p_score = entry.get("score", self.default_score)
+
+                pattern_key = self._pattern_key(entry)
+                if pattern_key in self._pattern_keys:
+                    n_duplicates += 1
+                    continue
+
+                slot = len(self._labels)
+                label = f"{p_label}_{self._next_key}"
+
+                # Reject the pattern before touching any slot or index, so a
+                # failed entry leaves no partial state behind
+                pattern = entry["pattern"]
+                if isinstance(pattern, list):
+                    # Token pattern - add directly; raises on invalid patterns
+                    self.matcher.add(label, [pattern])
+                elif not isinstance(pattern, str):
+                    raise ValueError(f"Pattern must be string or list of dicts, got {type(pattern)}")
+                self._next_key += 1
+
+                string_id = self.nlp.vocab.strings.add(label)
+                self._slot_by_string_id[string_id] = slot
+                self._string_ids_by_label.setdefault(p_label, set()).add(string_id)
+                if "id" in entry:
+                    self._string_ids_by_id.setdefault(p_id, set()).add(string_id)
+                self._keys.append(label)
+                self._labels.append(p_label)
+                self._label_hashes.append(self.nlp.vocab.strings.add(p_label))
+                self._ids.append(p_id)
+                # Resolved once here so the match loop needs no clamping or string interning
+                self._id_hashes.append(self.nlp.vocab.strings.add(p_id) if isinstance(p_id, str) else p_id)
+                self._scores.append(min(p_score, 1.0))
+                self._patterns.append(entry)
+                # Only registered patterns count as seen for duplicate detection
+                self._pattern_keys.add(pattern_key)
+
+                if isinstance(pattern, str):
+                    # Phrase pattern - counted with its slot, tokenized in one batch below
+                    phrase_pattern_labels.append(label)
+                    phrase_pattern_texts.append(pattern)
+                    self._phrase_refs[pattern] = self._phrase_refs.get(pattern, 0) + 1
+        finally:
+            # Also runs when a later entry raises, so every registered phrase
+            # pattern ends up in the PhraseMatcher
+            self._add_phrase_patterns(phrase_pattern_labels, phrase_pattern_texts)
+
+        if n_duplicates:
+            logger.debug("skipped %d duplicate patterns", n_duplicates)
+
+    def _add_phrase_patterns(self, labels: List[str], texts: List[str]) -> None:
+        """Tokenize phrase patterns and add them to the PhraseMatcher."""
+        # Only tokenize phrases that have not been seen before
+        phrase_docs = self._phrase_docs
+        new_texts = [text for text in dict.fromkeys(texts) if text not in phrase_docs]
+        if new_texts and self.phrase_matcher_attr in _LEXICAL_PHRASE_MATCHER_ATTRS:
+            for text, doc in zip(new_texts, self.nlp.tokenizer.pipe(new_texts)):
+                phrase_docs[text] = doc
+        elif new_texts:
+            # Temporarily disable the nlp components after this one in case they haven't been
+            # initialized / deserialized yet
+            try:
+                current_index = -1
+                for i, (name, pipe) in enumerate(self.nlp.pipeline):
+                    if self == pipe:
+                        current_index = i
+                        break
+                subsequent_pipes = [pipe for pipe in self.nlp.pipe_names[current_index:]]
+            except ValueError:
+                subsequent_pipes = []
+
+            with self.nlp.select_pipes(disable=subsequent_pipes):
+                for text, doc in zip(new_texts, self.nlp.pipe(new_texts)):
+                    phrase_docs[text] = doc
+
+        for label, text in zip(labels, texts):
+            self.phrase_matcher.add(label, [phrase_docs[text]])
+
+    def _pattern_key(self, entry: Pattern) -> Tuple[Any, ...]:
+        """Hashable key identifying a pattern by its label, pattern, ID and score."""
+        return (
+            entry["label"],
+            srsly.json_dumps(entry["pattern"], sort_keys=True),
+            entry.get("id"),
+            entry.get("score", self.default_score),
+        )
 
     def add_custom_matchers(self, matchers: Dict[str, Callable[[Doc], List[Tuple[int, int, float]]]]) -> None:
         """Add custom matchers to the recognizer.
@@ -296,19 +414,11 @@ class Recognizer(Pipe):
 
         label (str): Label of the patterns to be removed.
         """
-        if not any(p["label"] == label for p in self._patterns):
+        if label not in self._string_ids_by_label:
             raise ValueError(
                 Errors.E1024.format(attr_type="label", label=label, component=self.name)
             )
-        self._patterns = [p for p in self._patterns if p["label"] != label]
-        for m_label in self._match_label_id_map:
-            if self._match_label_id_map[m_label]["label"] == label:
-                m_label_str = self.nlp.vocab.strings.as_string(m_label)
-                if m_label_str in self.phrase_matcher:
-                    self.phrase_matcher.remove(m_label_str)
-                if m_label_str in self.matcher:
-                    self.matcher.remove(m_label_str)
-                del self._match_label_id_map[m_label]
+        self._remove_string_ids(self._string_ids_by_label[label])
 
     def remove_by_id(self, pattern_id: str) -> None:
         """Remove a pattern by its pattern ID.
@@ -316,22 +426,78 @@ class Recognizer(Pipe):
         pattern_id (str): ID of the pattern to be removed.
         """
         # Check if any pattern has the given ID
-        if not any(p.get("id") == pattern_id for p in self._patterns):
+        if pattern_id not in self._string_ids_by_id:
             raise ValueError(
                 Errors.E1024.format(attr_type="ID", label=pattern_id, component=self.name)
             )
-        
-        # Remove patterns from internal list
-        self._patterns = [p for p in self._patterns if p.get("id") != pattern_id]
-        
-        for m_label in self._match_label_id_map:
-            if self._match_label_id_map[m_label]["id"] == pattern_id:
-                m_label_str = self.nlp.vocab.strings.as_string(m_label)
-                if m_label_str in self.phrase_matcher:
-                    self.phrase_matcher.remove(m_label_str)
-                if m_label_str in self.matcher:
-                    self.matcher.remove(m_label_str)
-                del self._match_label_id_map[m_label]
+        self._remove_string_ids(self._string_ids_by_id[pattern_id])
+
+    def _remove_string_ids(self, string_ids: Iterable[int]) -> None:
+        """Remove matcher keys and their metadata from every index."""
+        for m_label in list(string_ids):
+            slot = self._slot_by_string_id.pop(m_label)
+            pattern = cast(Pattern, self._patterns[slot])
+            self._pattern_keys.discard(self._pattern_key(pattern))
+            self._patterns[slot] = None
+            text = pattern["pattern"]
+            if isinstance(text, str):
+                self._phrase_refs[text] -= 1
+                if not self._phrase_refs[text]:
+                    del self._phrase_refs[text]
+                    del self._phrase_docs[text]
+            m_label_str = self._keys[slot]
+            if m_label_str in self.phrase_matcher:
+                self.phrase_matcher.remove(m_label_str)
+            if m_label_str in self.matcher:
+                self.matcher.remove(m_label_str)
+
+            for index, key in (
+                (self._string_ids_by_label, self._labels[slot]),
+                (self._string_ids_by_id, self._ids[slot]),
+            ):
+                string_ids_for_key = index.get(key)
+                if string_ids_for_key is not None:
+                    string_ids_for_key.discard(m_label)
+                    if not string_ids_for_key:
+                        del index[key]
+            self._n_removed += 1
+
+        if self._n_removed * 2 > len(self._patterns):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop removed slots from the metadata arrays and remap the live ones."""
+        live = [slot for slot, pattern in enumerate(self._patterns) if pattern is not None]
+        new_slots = {slot: new_slot for new_slot, slot in enumerate(live)}
+        self._patterns = [self._patterns[slot] for slot in live]
+        self._keys = [self._keys[slot] for slot in live]
+        self._labels = [self._labels[slot] for slot in live]
+        self._label_hashes = [self._label_hashes[slot] for slot in live]
+        self._ids = [self._ids[slot] for slot in live]
+        self._id_hashes = [self._id_hashes[slot] for slot in live]
+        self._scores = [self._scores[slot] for slot in live]
+        self._slot_by_string_id = {
+            string_id: new_slots[slot] for string_id, slot in self._slot_by_string_id.items()
+        }
+        self._n_removed = 0
+
+    def _phrase_docs_to_bytes(self) -> bytes:
+        """Serialize the tokenized phrase patterns that are currently in use."""
+        texts = dict.fromkeys(p["pattern"] for p in self.patterns if isinstance(p["pattern"], str))
+        doc_bin = DocBin(store_user_data=False)
+        for text in texts:
+            doc_bin.add(self._phrase_docs[text])
+        return doc_bin.to_bytes()
+
+    def _phrase_docs_from_bytes(self, bytes_data: bytes) -> None:
+        """Fill the phrase doc cache so that loading patterns skips tokenization."""
+        for doc in DocBin().from_bytes(bytes_data).get_docs(self.nlp.vocab):
+            self._phrase_docs[doc.text] = doc
+
+    def _drop_unused_phrase_docs(self) -> None:
+        """Drop loaded phrase docs that no pattern ended up using."""
+        for text in [text for text in self._phrase_docs if text not in self._phrase_refs]:
+            del self._phrase_docs[text]
 
     def from_bytes(self, bytes_data: bytes, *, exclude: Iterable[str] = SimpleFrozenList()) -> "Recognizer":
         """Load the span ruler from a bytestring.
@@ -340,12 +506,15 @@ class Recognizer(Pipe):
         RETURNS (Recognizer): The loaded recognizer.
         """
         self.clear()
+        # phrase_docs must be loaded before patterns
         deserializers = {
-            "patterns": lambda b: self.add_patterns(cast(List[Pattern], srsly.json_loads(b))),
+            "phrase_docs": self._phrase_docs_from_bytes,
+            "patterns": lambda b: self.add_patterns(_patterns_from_bytes(b)),
             "custom_matchers": lambda b: self.add_custom_matchers(cast(Dict[str, Callable[[Doc], List[Tuple[int, int, float]]]], srsly.pickle_loads(b))),
             "validators": lambda b: self.add_validators(cast(Dict[str, Callable[[Span], bool]], srsly.pickle_loads(b))),
         }
         util.from_bytes(bytes_data, deserializers, exclude) # ty:ignore[invalid-argument-type]
+        self._drop_unused_phrase_docs()
         return self
 
     def to_bytes(self, *, exclude: Iterable[str] = SimpleFrozenList()) -> bytes:
@@ -354,7 +523,8 @@ class Recognizer(Pipe):
         RETURNS (bytes): The serialized patterns.
         """
         serializers = {
-            "patterns": lambda: srsly.json_dumps(self.patterns),
+            "phrase_docs": self._phrase_docs_to_bytes,
+            "patterns": lambda: srsly.msgpack_dumps(self.patterns),
             "custom_matchers": lambda: srsly.pickle_dumps(self._custom_matchers),
             "validators": lambda: srsly.pickle_dumps(self._validators),
         }
@@ -371,11 +541,14 @@ class Recognizer(Pipe):
         self.clear()
         path = ensure_path(path)
 
+        # phrase_docs must be loaded before patterns
         deserializers = {
+            "phrase_docs": lambda p: p.exists() and self._phrase_docs_from_bytes(p.read_bytes()),
             "patterns": lambda p: self.add_patterns(srsly.read_jsonl(p)), # ty:ignore[invalid-argument-type]
             "custom_matchers": lambda p: self.add_custom_matchers(read_pickle(p)),
         }
         util.from_disk(path, deserializers, exclude)  # ty:ignore[invalid-argument-type]
+        self._drop_unused_phrase_docs()
         return self
 
     def to_disk(
@@ -388,6 +561,7 @@ class Recognizer(Pipe):
         path = ensure_path(path)
 
         serializers = {
+            "phrase_docs": lambda p: p.write_bytes(self._phrase_docs_to_bytes()),
             "patterns": lambda p: srsly.write_jsonl(p, self.patterns), # ty:ignore[invalid-argument-type]
             "custom_matchers": lambda p: write_pickle(p, self._custom_matchers),
             "validators": lambda p: write_pickle(p, self._validators),
@@ -1,7 +1,7 @@
 import itertools
 from collections.abc import Iterable
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
 
 from spacy import registry
 from spacy.tokens import Span
@@ -25,17 +25,20 @@ class HierarchicalMergeFilter:
     """
 
     hierarchy: Dict[str, List[str]]
+    label_to_group: Dict[str, str] = field(init=False, repr=False, compare=False)
 
-    def __call__(
-        self, *spans: Iterable[Span]
-    ) -> Iterable[Span]:
+    def __post_init__(self) -> None:
+        # Resolved once per filter instead of on every call
         label_to_group: Dict[str, str] = {}
         for parent, children in self.hierarchy.items():
             label_to_group[parent.lower()] = parent.lower()
             label_to_group.update({child.lower(): parent.lower() for child in children})
-        
-        
-        return self._merge_hierarchical(*spans, label_to_group=label_to_group)
+        object.__setattr__(self, "label_to_group", label_to_group)
+
+    def __call__(
+        self, *spans: Iterable[Span]
+    ) -> Iterable[Span]:
+        return self._merge_hierarchical(*spans, label_to_group=self.label_to_group)
 
     def _merge_hierarchical(
         self,
@@ -57,64 +60,87 @@ class HierarchicalMergeFilter:
 
         doc = spans[0].doc
 
-        spans.sort(
-            key=lambda s: (getattr(s._, "score", 0.0), s.end - s.start, -s.start),
-            reverse=True,
-        )
-
-        token_group: Dict[int, str] = {}
-        accepted: List[Span] = []
-
-        for span in spans:
-            group = label_to_group.get(span.label_.lower(), span.label_.lower())
-            has_conflict = any(
-                t in token_group and token_group[t] != group
-                for t in range(span.start, span.end)
+        spans.sort(key=lambda s: s.start)
+        if all(
+            prev.start < curr.start and prev.end <= curr.start
+            for prev, curr in zip(spans, spans[1:])
+        ):
+            # Nothing overlaps, so there is nothing to resolve by score
+            accepted = spans
+        else:
+            # Group occupying each token, checked and filled with slice
+            # operations; sized to the tokens the spans cover, not the doc
+            offset = spans[0].start
+            token_group: List[Optional[str]] = [None] * (max(s.end for s in spans) - offset)
+
+            spans.sort(
+                key=lambda s: (s._.score, s.end - s.start, -s.start),
+                reverse=True,
             )
+            accepted = []
+
+            for span in spans:
+                group = label_to_group.get(span.label_.lower(), span.label_.lower())
+                start = span.start - offset
+                end = span.end - offset
+                occupied = token_group[start:end]
+                # A conflict is any token already taken by a different group
+                if occupied.count(None) + occupied.count(group) == len(occupied):
+                    token_group[start:end] = [group] * len(occupied)
+                    accepted.append(span)
 
-            if not has_conflict:
-                for t in range(span.start, span.end):
-                    token_group[t] = group
-                accepted.append(span)
+            accepted.sort(key=lambda s: s.start)
 
         if len(accepted) <= 1:
             return accepted
 
-        accepted.sort(key=lambda s: s.start)
-
-        merged: List[Span] = [accepted[0]]
+        # Entries that never merge stay the original Span; a merged entry is
+        # kept as a (start, end, label, score) tuple and only built as a Span
+        # once at the end. Scores are only read when two spans actually merge.
+        merged: List[Union[Span, Tuple[int, int, str, float]]] = [accepted[0]]
 
         for current in accepted[1:]:
             previous = merged[-1]
-            prev_label = previous.label_.lower()
+            if isinstance(previous, Span):
+                prev_start, prev_end, prev_label_ = previous.start, previous.end, previous.label_
+            else:
+                prev_start, prev_end, prev_label_, prev_score = previous
+            prev_label = prev_label_.lower()
             curr_label = current.label_.lower()
             prev_group = label_to_group.get(prev_label, prev_label)
             curr_group = label_to_group.get(curr_label, curr_label)
 
             is_same_group = prev_group == curr_group
-            is_adjacent_or_overlapping = current.start <= previous.end
+            is_adjacent_or_overlapping = current.start <= prev_end
 
             if is_adjacent_or_overlapping and is_same_group:
+                if isinstance(previous, Span):
+                    prev_score = previous._.score
+                curr_score = current._.score
                 curr_is_more_specific = curr_label != curr_group
                 prev_is_more_specific = prev_label != prev_group
 
-                curr_priority = (curr_is_more_specific, getattr(current._, "score", 0.0))
-                prev_priority = (prev_is_more_specific, getattr(previous._, "score", 0.0))
+                curr_priority = (curr_is_more_specific, curr_score)
+                prev_priority = (prev_is_more_specific, prev_score)
 
-                winner = current if curr_priority > prev_priority else previous
+                if curr_priority > prev_priority:
+                    winner_label, winner_score = current.label_, curr_score
+                else:
+                    winner_label, winner_score = prev_label_, prev_score
 
-                merged_span = Span(
-                    doc,
-                    previous.start,
-                    max(previous.end, current.end),
-                    label=winner.label_,
-                )
-                merged_span._.score = getattr(winner._, "score", 0.0)
-                merged[-1] = merged_span
+                merged[-1] = (prev_start, max(prev_end, current.end), winner_label, winner_score)
             else:
                 merged.append(current)
 
-        return merged
+        result: List[Span] = []
+        for entry in merged:
+            if not isinstance(entry, Span):
+                start, end, label, score = entry
+                entry = Span(doc, start, end, label=label)
+                entry._.score = score
+            result.append(entry)
+
+        return result
 
 @registry.misc("maskpipe.hierarchical_merge_filter.v1")
 def make_hierarchical_merge_filter(
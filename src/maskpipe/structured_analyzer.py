@@ -106,11 +106,7 @@ class StructuredAnalyzer:
                     start=ent.start_char,
                     end=ent.end_char,
                     label=ent.label_,
-                    score=(
-                        ent._.score
-                        if ent.has_extension("score")
-                        else self.default_score
-                    ),
+                    score=ent._.score,
                 )
             )
 
@@ -0,0 +1,65 @@
+from spacy.lang.nl import Dutch
+
+from maskpipe import PipelineBuilder
+from maskpipe.entities import CREDIT_CARD, IBAN, nl
+from maskpipe.entities.phone_number import PhoneNumberMatcher
+
+def _build(entities):
+    nlp = Dutch()
+    builder = PipelineBuilder(nlp, disable=["context_enhancer", "conflict_resolver", "anonymizer"])
+    builder.add_entities(entities)
+    return builder.build()
+
+def test_iban_matches_compact_iban():
+    nlp = _build([IBAN])
+
+    doc = nlp("Mijn rekening is NL91ABNA0417164300.")
+
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [("NL91ABNA0417164300", "IBAN")]
+
+def test_iban_rejects_invalid_checksum():
+    nlp = _build([IBAN])
+
+    doc = nlp("Mijn rekening is NL92ABNA0417164300.")
+
+    assert len(doc.spans["sc"]) == 0
+
+def test_iban_does_not_match_inside_word():
+    nlp = _build([IBAN])
+
+    doc = nlp("Referentie XNL91ABNA0417164300.")
+
+    assert len(doc.spans["sc"]) == 0
+
+def test_bsn_passes_elf_proef():
+    nlp = _build([nl.BSN])
+
+    doc = nlp("Mijn bsn is 111222333 en 111.222.333.")
+
+    assert [s.text for s in doc.spans["sc"]] == ["111222333", "111.222.333"]
+
+def test_bsn_matches_eight_digits_with_leading_zero_dropped():
+    nlp = _build([nl.BSN])
+
+    doc = nlp("Mijn bsn is 12345672.")
+
+    assert [s.text for s in doc.spans["sc"]] == ["12345672"]
+
+def test_bsn_rejects_failed_elf_proef_and_repeated_digits():
+    nlp = _build([nl.BSN])
+
+    doc = nlp("Geen bsn: 111222334, 999999999 of 00000000.")
+
+    assert len(doc.spans["sc"]) == 0
+
+def test_credit_card_passes_luhn_checksum():
+    nlp = _build([CREDIT_CARD])
+
+    doc = nlp("Kaart 4111-1111-1111-1111 en 4111111111111112.")
+
+    assert [s.text for s in doc.spans["sc"]] == ["4111-1111-1111-1111"]
+
+def test_phone_number_matcher_reports_each_number_once():
+    doc = Dutch()("Bel 06-12345678 of +31 20 123 4567.")
+
+    assert PhoneNumberMatcher()(doc) == [(1, 2, 0.4), (3, 7, 0.4)]
@@ -1,5 +1,22 @@
+from itertools import chain
+
 from spacy.lang.nl import Dutch
 
+from maskpipe.recognizer import anonymacy_levenshtein_compare
+
+class _CountingTokenizer:
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.texts = []
+
+    def __call__(self, text):
+        return self.tokenizer(text)
+
+    def pipe(self, texts):
+        texts = list(texts)
+        self.texts.extend(texts)
+        return self.tokenizer.pipe(texts)
+
 def test_pattern_without_score_gets_default_score():
     nlp = Dutch()
     default_score = 0.8
@@ -88,4 +105,252 @@ def test_no_duplicate_spans():
     doc = nlp("Mijn naam is Anna de Vries en ik werk bij Acme Corp.")
 
     assert len(doc.spans['sc']) == 1
-    assert doc.spans['sc'][0]._.score == 0.9
\ No newline at end of file
+    assert doc.spans['sc'][0]._.score == 0.9
+
+def test_remove_label():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([
+        { "label": "persoon", "pattern": "Anna de Vries" },
+        { "label": "persoon", "pattern": [{"LOWER": "piet"}] },
+        { "label": "organisatie", "pattern": "Acme Corp." },
+    ])
+
+    recognizer.remove("persoon")
+    doc = nlp("Anna de Vries en Piet werken bij Acme Corp.")
+
+    assert "persoon" not in recognizer
+    assert "organisatie" in recognizer
+    assert [s.label_ for s in doc.spans['sc']] == ["organisatie"]
+
+def test_remove_by_id():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([
+        { "label": "persoon", "pattern": "Anna de Vries", "id": "anna" },
+        { "label": "persoon", "pattern": "Piet", "id": "piet" },
+    ])
+
+    recognizer.remove_by_id("anna")
+    recognizer.add_patterns([
+        { "label": "organisatie", "pattern": "Acme Corp." },
+    ])
+    doc = nlp("Anna de Vries en Piet werken bij Acme Corp.")
+
+    assert [(s.text, s.id_) for s in doc.spans['sc']] == [("Piet", "piet"), ("Acme Corp.", "")]
+
+def test_invalid_best_match_falls_back_to_next_best():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([
+        { "label": "bsn", "pattern": [{"IS_DIGIT": True}], "score": 0.9 },
+        { "label": "nummer", "pattern": [{"IS_DIGIT": True}], "score": 0.5 },
+    ])
+    recognizer.add_validators({ "bsn": lambda span: False })
+
+    doc = nlp("Mijn nummer is 123456789.")
+
+    assert [(s.text, s.label_, s._.score) for s in doc.spans['sc']] == [("123456789", "nummer", 0.5)]
+
+def test_to_bytes_from_bytes_roundtrip():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([
+        { "label": "persoon", "pattern": "Anna de Vries", "id": "anna", "score": 0.9 },
+        { "label": "getal", "pattern": [{"LIKE_NUM": True}] },
+    ])
+
+    other = Dutch().add_pipe("recognizer")
+    other.from_bytes(recognizer.to_bytes())
+
+    assert other.patterns == recognizer.patterns
+    assert other.labels == ("getal", "persoon")
+
+def test_to_disk_from_disk_reuses_phrase_docs(tmp_path):
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([{ "label": "persoon", "pattern": "Anna de Vries" }])
+    recognizer.to_disk(tmp_path)
+
+    other_nlp = Dutch()
+    other_nlp.tokenizer = _CountingTokenizer(other_nlp.tokenizer)
+    other = other_nlp.add_pipe("recognizer")
+    other.from_disk(tmp_path)
+    other.from_bytes(recognizer.to_bytes())
+    doc = other_nlp("Gisteren belde Anna de Vries.")
+
+    assert other_nlp.tokenizer.texts == []
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [("Anna de Vries", "persoon")]
+
+def test_custom_matcher_skips_empty_and_out_of_range_spans():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_custom_matchers({
+        "getal": lambda doc: [(1, 1, 0.9), (2, 99, 0.9), (3, 4, 0.9)],
+    })
+
+    doc = nlp("Het getal is 42 .")
+
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [("42", "getal")]
+
+def test_existing_spans_are_kept_without_overwrite():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([{ "label": "persoon", "pattern": "Anna de Vries" }])
+
+    doc = nlp.make_doc("Acme Corp. belde Anna de Vries.")
+    doc.spans["sc"] = [doc.char_span(0, 10, label="organisatie")]
+    doc = recognizer(doc)
+
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [
+        ("Acme Corp.", "organisatie"),
+        ("Anna de Vries", "persoon"),
+    ]
+
+def test_duplicate_patterns_are_added_once():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    pattern = { "label": "persoon", "pattern": "Anna de Vries", "id": "anna" }
+    recognizer.add_patterns([pattern, dict(pattern)])
+    recognizer.add_patterns([dict(pattern), { "label": "persoon", "pattern": "Anna de Vries", "score": 0.9 }])
+
+    assert len(recognizer.patterns) == 2
+
+    recognizer.remove_by_id("anna")
+    recognizer.add_patterns([pattern])
+
+    assert len(recognizer.patterns) == 2
+
+def test_no_matches_keeps_existing_spans_and_creates_missing_group():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([{ "label": "persoon", "pattern": "Anna de Vries" }])
+
+    doc = recognizer(nlp.make_doc("Niemand belde."))
+    assert len(doc.spans["sc"]) == 0
+
+    doc = nlp.make_doc("Acme Corp. belde.")
+    doc.spans["sc"] = [doc.char_span(0, 10, label="organisatie")]
+    doc = recognizer(doc)
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [("Acme Corp.", "organisatie")]
+
+def test_generator_spans_filter_is_consumed_before_extending():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([{ "label": "persoon", "pattern": "Anna de Vries" }])
+    recognizer.spans_filter = lambda spans, matches: (
+        s for s in chain(spans, matches) if s.label_ == "persoon"
+    )
+
+    doc = nlp.make_doc("Acme Corp. belde Anna de Vries.")
+    doc.spans["sc"] = [doc.char_span(0, 10, label="organisatie")]
+    doc = recognizer(doc)
+
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [
+        ("Acme Corp.", "organisatie"),
+        ("Anna de Vries", "persoon"),
+    ]
+
+def test_re_adding_phrase_skips_tokenization():
+    nlp = Dutch()
+    nlp.tokenizer = _CountingTokenizer(nlp.tokenizer)
+    recognizer = nlp.add_pipe("recognizer")
+
+    recognizer.add_patterns([{ "label": "persoon", "pattern": "Anna de Vries" }])
+    recognizer.add_patterns([{ "label": "klant", "pattern": "Anna de Vries" }])
+
+    assert nlp.tokenizer.texts == ["Anna de Vries"]
+
+def test_phrase_docs_are_released_with_their_patterns():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([
+        { "label": "persoon", "pattern": "Anna de Vries" },
+        { "label": "klant", "pattern": "Anna de Vries" },
+        { "label": "klant", "pattern": "Acme Corp." },
+    ])
+
+    recognizer.remove("klant")
+    assert list(recognizer._phrase_docs) == ["Anna de Vries"]
+
+    recognizer.clear()
+    assert recognizer._phrase_docs == {}
+
+def test_removed_slots_are_compacted():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([{ "label": "persoon", "pattern": "Anna de Vries", "score": 0.9 }])
+
+    for i in range(50):
+        recognizer.add_patterns([{ "label": "getal", "pattern": [{"LIKE_NUM": True}], "id": f"g{i}" }])
+        recognizer.remove_by_id(f"g{i}")
+    recognizer.add_patterns([{ "label": "getal", "pattern": [{"LIKE_NUM": True}] }])
+
+    assert len(recognizer._patterns) <= 4
+    doc = nlp("Anna de Vries is 42.")
+    assert [(s.text, s.label_, s._.score) for s in doc.spans["sc"]] == [
+        ("Anna de Vries", "persoon", 0.9),
+        ("42", "getal", recognizer.default_score),
+    ]
+
+def test_default_fuzzy_compare_is_memoized_and_matches():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+    recognizer.add_patterns([{ "label": "persoon", "pattern": [{"LOWER": {"FUZZY": "vries"}}] }])
+
+    doc = nlp("Mevrouw Vreis belde.")
+
+    assert recognizer.matcher_fuzzy_compare is anonymacy_levenshtein_compare
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [("Vreis", "persoon")]
+
+def test_rejected_pattern_leaves_no_state():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer", config={ "validate_patterns": True })
+
+    for bad in ({ "label": "X", "pattern": 42 }, { "label": "X", "pattern": [{"NOPE": 1}] }):
+        try:
+            recognizer.add_patterns([bad])
+            assert False, "Expected the pattern to be rejected"
+        except ValueError:
+            pass
+
+    assert recognizer.patterns == []
+    assert "X" not in recognizer
+    other = Dutch().add_pipe("recognizer")
+    other.from_bytes(recognizer.to_bytes())
+    assert other.patterns == []
+
+def test_rejected_pattern_is_not_treated_as_duplicate():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+
+    for _ in range(2):
+        try:
+            recognizer.add_patterns([{ "label": "X", "pattern": 42 }])
+            assert False, "Expected ValueError for invalid pattern type"
+        except ValueError:
+            pass
+
+def test_phrases_before_a_rejected_pattern_are_fully_added():
+    nlp = Dutch()
+    recognizer = nlp.add_pipe("recognizer")
+
+    try:
+        recognizer.add_patterns([
+            { "label": "A", "pattern": "foo bar" },
+            { "label": "B", "pattern": 42 },
+        ])
+        assert False, "Expected ValueError for invalid pattern type"
+    except ValueError:
+        pass
+
+    doc = nlp("zeg foo bar")
+    assert [(s.text, s.label_) for s in doc.spans["sc"]] == [("foo bar", "A")]
+
+    recognizer.remove("A")
+    assert recognizer._phrase_docs == {}
+    try:
+        recognizer.remove("A")
+        assert False, "Expected ValueError for unknown label"
+    except ValueError:
+        pass
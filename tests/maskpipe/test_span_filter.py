@@ -0,0 +1,31 @@
+from spacy.lang.nl import Dutch
+from spacy.tokens import Span
+
+from maskpipe.span_filter import hierarchical_merge_filter
+
+def _span(doc, start, end, label, score):
+    span = Span(doc, start, end, label=label)
+    span._.score = score
+    return span
+
+def test_overlapping_spans_of_other_groups_keep_highest_score():
+    doc = Dutch()("Bel 0612345678 vandaag nog")
+    spans = [
+        _span(doc, 1, 2, "bsn", 0.5),
+        _span(doc, 1, 3, "phone_number", 0.8),
+    ]
+
+    result = hierarchical_merge_filter(spans)
+
+    assert [(s.start, s.end, s.label_) for s in result] == [(1, 3, "phone_number")]
+
+def test_adjacent_spans_of_same_group_merge_to_most_specific_label():
+    doc = Dutch()("Anna de Vries belde")
+    spans = [
+        _span(doc, 0, 1, "first_name", 0.6),
+        _span(doc, 1, 3, "name", 0.9),
+    ]
+
+    result = hierarchical_merge_filter(spans)
+
+    assert [(s.start, s.end, s.label_, s._.score) for s in result] == [(0, 3, "first_name", 0.6)]